@@ -1,5 +1,9 @@
 """KeyManager component for API key lifecycle management."""
 
+import asyncio
+import heapq
+import itertools
+import time
 import uuid
 from collections.abc import Callable
 from datetime import datetime, timedelta
@@ -41,6 +45,126 @@ class KeyNotFoundError(Exception):
     pass
 
 
+class _ProviderKeyIndex:
+    """In-process eligibility index for the keys of a single provider.
+
+    Keys are grouped by KeyState. Throttled keys that are still cooling down
+    sit in a min-heap ordered by ``cooldown_until`` so that expired cooldowns
+    can be promoted without scanning every throttled key. Heap entries are
+    invalidated lazily: an entry is only honoured if the key is still
+    Throttled with the same ``cooldown_until``.
+    """
+
+    # States whose keys are always eligible
+    _ELIGIBLE_STATES = (KeyState.Available, KeyState.Recovering)
+
+    def __init__(self) -> None:
+        """Initialize an empty, not yet loaded, provider index."""
+        # Monotonic time of the last load from the StateStore (None = never loaded)
+        self.loaded_at: float | None = None
+        self._keys: dict[str, APIKey] = {}
+        # First-indexed order (stable selection order) and last-write revision
+        self._sequence: dict[str, int] = {}
+        self._revision: dict[str, int] = {}
+        self._by_state: dict[KeyState, dict[str, APIKey]] = {state: {} for state in KeyState}
+        # Throttled keys whose cooldown has expired (or was never set)
+        self._cooled: set[str] = set()
+        self._cooldown_heap: list[tuple[datetime, str]] = []
+
+    def __contains__(self, key_id: object) -> bool:
+        """Return True if the key is tracked by this index."""
+        return key_id in self._keys
+
+    def is_stale(self, now: float, refresh_seconds: float) -> bool:
+        """Return True if the index must be (re)loaded from the StateStore.
+
+        Args:
+            now: Current monotonic time.
+            refresh_seconds: Maximum age of a load before it is refreshed.
+        """
+        return self.loaded_at is None or now - self.loaded_at >= refresh_seconds
+
+    def upsert(self, key: APIKey, sequence: int) -> None:
+        """Insert or replace a key, moving it to the group for its current state.
+
+        Args:
+            key: The key to index.
+            sequence: Monotonic write number. Also fixes the key's order the
+                first time it is indexed.
+        """
+        self.remove(key.id)
+        self._keys[key.id] = key
+        self._sequence.setdefault(key.id, sequence)
+        self._revision[key.id] = sequence
+        self._by_state[key.state][key.id] = key
+
+        if key.state == KeyState.Throttled:
+            if key.cooldown_until is None:
+                self._cooled.add(key.id)
+            else:
+                heapq.heappush(self._cooldown_heap, (key.cooldown_until, key.id))
+
+    def remove(self, key_id: str) -> None:
+        """Remove a key from its state group (heap entries expire lazily).
+
+        Args:
+            key_id: The unique identifier of the key.
+        """
+        key = self._keys.pop(key_id, None)
+        if key is None:
+            return
+        self._revision.pop(key_id, None)
+        for group in self._by_state.values():
+            group.pop(key_id, None)
+        self._cooled.discard(key_id)
+
+    def sync(self, stored_keys: list[APIKey], since: int, next_sequence: Callable[[], int]) -> None:
+        """Merge a StateStore listing taken after write number ``since``.
+
+        Stored copies replace indexed keys unless the key was written
+        in-process after the listing started, and keys missing from the
+        listing are dropped under the same rule.
+
+        Args:
+            stored_keys: Keys listed from the StateStore for this provider.
+            since: Write number taken just before the listing was requested.
+            next_sequence: Source of new write numbers.
+        """
+        stored_ids = set()
+        for key in stored_keys:
+            stored_ids.add(key.id)
+            if self._revision.get(key.id, -1) < since:
+                self.upsert(key, next_sequence())
+        for key_id in [key_id for key_id in self._keys if key_id not in stored_ids]:
+            if self._revision[key_id] < since:
+                self.remove(key_id)
+
+    def eligible(self, now: datetime) -> list[APIKey]:
+        """Return eligible keys in stable (first indexed) order.
+
+        Args:
+            now: Current timestamp for cooldown comparison.
+
+        Returns:
+            List of eligible APIKey objects.
+        """
+        throttled = self._by_state[KeyState.Throttled]
+        heap = self._cooldown_heap
+        while heap and heap[0][0] <= now:
+            cooldown_until, key_id = heapq.heappop(heap)
+            key = throttled.get(key_id)
+            if key is not None and key.cooldown_until == cooldown_until:
+                self._cooled.add(key_id)
+
+        eligible: list[APIKey] = []
+        for state in self._ELIGIBLE_STATES:
+            eligible.extend(self._by_state[state].values())
+        eligible.extend(throttled[key_id] for key_id in self._cooled if key_id in throttled)
+
+        eligible.sort(key=lambda key: self._sequence[key.id])
+        return eligible
+
+
 class KeyManager:
     """Manages API key lifecycle, state transitions, and key selection eligibility.
 
@@ -78,6 +202,7 @@ class KeyManager:
         observability_manager: ObservabilityManager,
         default_cooldown_seconds: int = 60,
         encryption_service: EncryptionService | None = None,
+        index_refresh_seconds: float = 5.0,
     ) -> None:
         """Initialize KeyManager with dependencies.
 
@@ -87,11 +212,27 @@ class KeyManager:
             default_cooldown_seconds: Default cooldown period for Throttled state.
             encryption_service: Optional EncryptionService instance. If None, creates one
                 using environment variable or settings.
+            index_refresh_seconds: Maximum age of the per-provider eligible-key index
+                before it is resynced from the StateStore (default: 5.0). Bounds how
+                long changes written by other processes go unnoticed.
+
+        Raises:
+            ValueError: If index_refresh_seconds is negative.
         """
+        if index_refresh_seconds < 0:
+            raise ValueError("index_refresh_seconds must be non-negative")
+
         self._state_store = state_store
         self._observability = observability_manager
         self._default_cooldown_seconds = default_cooldown_seconds
 
+        # Eligible-key index per provider, loaded lazily from the StateStore
+        # and resynced once older than index_refresh_seconds
+        self._index_refresh_seconds = index_refresh_seconds
+        self._key_index: dict[str, _ProviderKeyIndex] = {}
+        self._index_sequence = itertools.count()
+        self._index_load_lock = asyncio.Lock()
+
         # Initialize EncryptionService
         if encryption_service is None:
             try:
@@ -159,6 +300,8 @@ class KeyManager:
         except StateStoreError as e:
             raise KeyRegistrationError(f"Failed to save key to StateStore: {e}") from e
 
+        self._index_key(api_key)
+
         # Emit key_registered event
         try:
             await self._observability.emit_event(
@@ -288,6 +431,8 @@ class KeyManager:
         except StateStoreError as e:
             raise StateStoreError(f"Failed to save state transition: {e}") from e
 
+        self._index_key(key)
+
         # Emit state_transition event
         try:
             await self._observability.emit_event(
@@ -335,6 +480,10 @@ class KeyManager:
         # Get all keys
         all_keys = await self._state_store.list_keys()
 
+        # Full listing doubles as a resync point for the eligible-key index,
+        # picking up keys written to a shared StateStore by other processes
+        self._rebuild_index(all_keys)
+
         for key in all_keys:
             # Check if Throttled key's cooldown has expired
             if (
@@ -371,42 +520,6 @@ class KeyManager:
         """
         return await self._state_store.get_key(key_id)
 
-    def _is_key_eligible_by_state(self, key: APIKey, now: datetime) -> bool:
-        """Check if a key is eligible based on its state.
-
-        Args:
-            key: The APIKey to check.
-            now: Current timestamp for cooldown comparison.
-
-        Returns:
-            True if key is eligible by state, False otherwise.
-        """
-        # Disabled keys are never eligible
-        if key.state == KeyState.Disabled:
-            return False
-
-        # Invalid keys are never eligible
-        if key.state == KeyState.Invalid:
-            return False
-
-        # Exhausted keys are not eligible (unless Recovering, which is handled below)
-        if key.state == KeyState.Exhausted:
-            return False
-
-        # Throttled keys are eligible only if cooldown has expired
-        if key.state == KeyState.Throttled:
-            if key.cooldown_until is None:
-                return True  # No cooldown set, consider eligible
-            return bool(now >= key.cooldown_until)
-
-        # Recovering keys are eligible
-        if key.state == KeyState.Recovering:
-            return True
-
-        # Available keys are always eligible
-        # Unknown state - default to not eligible
-        return bool(key.state == KeyState.Available)
-
     async def get_eligible_keys(
         self,
         provider_id: str,
@@ -418,6 +531,12 @@ class KeyManager:
         - State (excludes Disabled, Invalid, Throttled if in cooldown, Exhausted)
         - Policy constraints (if policy provided)
 
+        Keys are served from an in-process index grouped by KeyState. Changes
+        made through KeyManager keep the index current; the StateStore is only
+        queried when a provider is first looked up and when its index is older
+        than ``index_refresh_seconds``, which picks up changes written by other
+        processes.
+
         Args:
             provider_id: Provider identifier to filter keys by.
             policy: Optional policy function that filters keys further.
@@ -429,12 +548,9 @@ class KeyManager:
         Raises:
             StateStoreError: If querying StateStore fails.
         """
-        # Query StateStore for keys by provider_id
-        all_keys = await self._state_store.list_keys(provider_id=provider_id)
-
-        # Filter by state
-        now = datetime.utcnow()
-        state_eligible_keys = [key for key in all_keys if self._is_key_eligible_by_state(key, now)]
+        # Serve from the in-process index (resynced from StateStore when stale)
+        index = await self._get_provider_index(provider_id)
+        state_eligible_keys = index.eligible(datetime.utcnow())
 
         # Apply policy-based filtering if policy provided
         if policy is not None:
@@ -461,6 +577,98 @@ class KeyManager:
 
         return state_eligible_keys
 
+    async def update_key(self, key: APIKey) -> None:
+        """Persist an updated API key and refresh the eligible-key index.
+
+        Use this for changes that are not state transitions, such as usage
+        and failure counters, so that eligibility lookups see the latest key.
+
+        Args:
+            key: The updated APIKey.
+
+        Raises:
+            StateStoreError: If save operation fails.
+        """
+        await self._state_store.save_key(key)
+        self._index_key(key)
+
+    def invalidate_index(self, provider_id: str | None = None) -> None:
+        """Drop the eligible-key index so it is reloaded on the next lookup.
+
+        Args:
+            provider_id: Provider whose index to drop. If None, drops all providers.
+        """
+        if provider_id is None:
+            self._key_index.clear()
+        else:
+            self._key_index.pop(provider_id, None)
+
+    def _index_key(self, key: APIKey) -> None:
+        """Add or update a key in the eligible-key index.
+
+        Args:
+            key: The key to index.
+        """
+        index = self._key_index.get(key.provider_id)
+        if index is None:
+            index = self._key_index[key.provider_id] = _ProviderKeyIndex()
+
+        # A key whose provider changed must not stay eligible under the old one
+        for provider_id, other in self._key_index.items():
+            if provider_id != key.provider_id and key.id in other:
+                other.remove(key.id)
+
+        index.upsert(key, next(self._index_sequence))
+
+    def _rebuild_index(self, keys: list[APIKey]) -> None:
+        """Replace the whole eligible-key index with a full key listing.
+
+        Args:
+            keys: All keys currently in the StateStore.
+        """
+        self._key_index.clear()
+        for key in keys:
+            self._index_key(key)
+        loaded_at = time.monotonic()
+        for index in self._key_index.values():
+            index.loaded_at = loaded_at
+
+    async def _get_provider_index(self, provider_id: str) -> _ProviderKeyIndex:
+        """Return the index for a provider, (re)loading it from StateStore if stale.
+
+        Stored copies replace indexed keys, except keys written in-process
+        while the listing was in flight.
+
+        Args:
+            provider_id: Provider identifier.
+
+        Returns:
+            The loaded provider index.
+
+        Raises:
+            StateStoreError: If querying StateStore fails.
+        """
+        index = self._key_index.get(provider_id)
+        if index is not None and not index.is_stale(time.monotonic(), self._index_refresh_seconds):
+            return index
+
+        async with self._index_load_lock:
+            index = self._key_index.get(provider_id)
+            if index is not None and not index.is_stale(
+                time.monotonic(), self._index_refresh_seconds
+            ):
+                return index
+
+            since = next(self._index_sequence)
+            stored_keys = await self._state_store.list_keys(provider_id=provider_id)
+
+            index = self._key_index.get(provider_id)
+            if index is None:
+                index = self._key_index[provider_id] = _ProviderKeyIndex()
+            index.sync(stored_keys, since, lambda: next(self._index_sequence))
+            index.loaded_at = time.monotonic()
+            return index
+
     async def revoke_key(self, key_id: str) -> None:
         """Revoke an API key by setting its state to Disabled.
 
@@ -570,6 +778,8 @@ class KeyManager:
         except StateStoreError as e:
             raise StateStoreError(f"Failed to save rotated key: {e}") from e
 
+        self._index_key(rotated_key)
+
         # Create StateTransition for rotation audit trail
         rotation_transition = StateTransition(
             entity_type="APIKey",
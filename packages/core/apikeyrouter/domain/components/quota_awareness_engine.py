@@ -448,6 +448,45 @@ class QuotaAwarenessEngine:
             quota_state = await self._initialize_quota_state(key_id)
             return quota_state
 
+    async def get_quota_states(self, key_ids: list[str]) -> dict[str, QuotaState]:
+        """Retrieve quota states for several keys at once.
+
+        Reads all existing states with a single bulk StateStore lookup and
+        only falls back to get_quota_state() (which initializes missing
+        states under the per-key lock) for keys that have no stored state yet.
+
+        Args:
+            key_ids: Unique identifiers of the keys.
+
+        Returns:
+            Dictionary mapping key_id to QuotaState (initialized if missing).
+            Keys whose initialization fails are logged and omitted.
+
+        Raises:
+            StateStoreError: If the bulk retrieval fails.
+        """
+        quota_states = await self._state_store.get_quota_states(key_ids)
+
+        missing = [key_id for key_id in dict.fromkeys(key_ids) if key_id not in quota_states]
+        if missing:
+            initialized = await asyncio.gather(
+                *(self.get_quota_state(key_id) for key_id in missing),
+                return_exceptions=True,
+            )
+            for key_id, result in zip(missing, initialized, strict=True):
+                if isinstance(result, BaseException):
+                    if not isinstance(result, Exception):
+                        raise result
+                    await self._observability.log(
+                        level="WARNING",
+                        message=f"Failed to initialize quota state for key {key_id}: {result}",
+                        context={"key_id": key_id},
+                    )
+                    continue
+                quota_states[key_id] = result
+
+        return quota_states
+
     async def handle_quota_response(
         self,
         key_id: str,
@@ -1,9 +1,11 @@
 """RoutingEngine component for intelligent API key routing."""
 
+import asyncio
 import uuid
+from collections.abc import Awaitable, Iterable
 from datetime import datetime
 from decimal import Decimal
-from typing import Any
+from typing import Any, TypeVar
 
 from apikeyrouter.domain.components.cost_controller import CostController
 from apikeyrouter.domain.components.key_manager import KeyManager
@@ -22,6 +24,7 @@ from apikeyrouter.domain.interfaces.observability_manager import ObservabilityMa
 from apikeyrouter.domain.interfaces.provider_adapter import ProviderAdapter
 from apikeyrouter.domain.interfaces.state_store import StateStore
 from apikeyrouter.domain.models.api_key import APIKey, KeyState
+from apikeyrouter.domain.models.budget import Budget, EnforcementMode
 from apikeyrouter.domain.models.budget_check_result import BudgetCheckResult
 from apikeyrouter.domain.models.cost_estimate import CostEstimate
 from apikeyrouter.domain.models.policy import PolicyScope, PolicyType
@@ -33,6 +36,8 @@ from apikeyrouter.domain.models.routing_decision import (
     RoutingObjective,
 )
 
+T = TypeVar("T")
+
 
 class NoEligibleKeysError(Exception):
     """Raised when no eligible keys are available for routing."""
@@ -40,6 +45,10 @@ class NoEligibleKeysError(Exception):
     pass
 
 
+# Default cap on concurrent per-key lookups issued by a single routing decision
+DEFAULT_MAX_CONCURRENT_LOOKUPS = 16
+
+
 class RoutingEngine:
     """Makes intelligent routing decisions based on explicit objectives.
 
@@ -56,6 +65,7 @@ class RoutingEngine:
         providers: dict[str, ProviderAdapter] | None = None,
         policy_engine: PolicyEngine | None = None,
         cost_controller: CostController | None = None,
+        max_concurrent_lookups: int = DEFAULT_MAX_CONCURRENT_LOOKUPS,
     ) -> None:
         """Initialize RoutingEngine with dependencies.
 
@@ -67,7 +77,15 @@ class RoutingEngine:
             providers: Optional dict mapping provider_id to ProviderAdapter for cost estimation.
             policy_engine: Optional PolicyEngine for policy-based routing constraints.
             cost_controller: Optional CostController for cost estimation and budget enforcement.
+            max_concurrent_lookups: Maximum number of per-key cost, budget and quota
+                lookups in flight at once during a routing decision (default: 16).
+
+        Raises:
+            ValueError: If max_concurrent_lookups is less than 1.
         """
+        if max_concurrent_lookups < 1:
+            raise ValueError("max_concurrent_lookups must be at least 1")
+
         self._key_manager = key_manager
         self._state_store = state_store
         self._observability = observability_manager
@@ -75,6 +93,9 @@ class RoutingEngine:
         self._providers = providers or {}
         self._policy_engine = policy_engine
         self._cost_controller = cost_controller
+        # Bounds per-key fan-out so large pools don't exhaust backend connection pools
+        self._max_concurrent_lookups = max_concurrent_lookups
+        self._lookup_semaphore = asyncio.Semaphore(max_concurrent_lookups)
 
         # Initialize routing strategies
         self._cost_strategy = CostOptimizedStrategy(
@@ -164,31 +185,36 @@ class RoutingEngine:
             scores: dict[str, float] = {}
             costs: list[Decimal] = []
 
-            # Get cost estimates for each key
-            for key in keys:
-                try:
-                    cost_estimate = await self._cost_controller.estimate_request_cost(
-                        request_intent=request_intent,
-                        provider_id=key.provider_id,
-                        key_id=key.id,
-                    )
-                    costs.append(cost_estimate.amount)
-                except Exception as e:
-                    # If cost estimation fails, use fallback
-                    await self._observability.log(
-                        level="WARNING",
-                        message=f"Failed to estimate cost for key {key.id}: {e}",
-                        context={"key_id": key.id, "provider_id": key.provider_id},
-                    )
-                    # Fallback to metadata or default cost
-                    cost_value = key.metadata.get("estimated_cost_per_request")
-                    if cost_value is not None:
-                        try:
-                            costs.append(Decimal(str(cost_value)))
-                        except (ValueError, TypeError):
-                            costs.append(Decimal("0.01"))
-                    else:
+            # Get cost estimates for all keys concurrently
+            estimates = await self._gather_bounded(
+                self._cost_controller.estimate_request_cost(
+                    request_intent=request_intent,
+                    provider_id=key.provider_id,
+                    key_id=key.id,
+                )
+                for key in keys
+            )
+            for key, estimate in zip(keys, estimates, strict=True):
+                if not isinstance(estimate, BaseException):
+                    costs.append(estimate.amount)
+                    continue
+                if not isinstance(estimate, Exception):
+                    raise estimate
+                # If cost estimation fails, use fallback
+                await self._observability.log(
+                    level="WARNING",
+                    message=f"Failed to estimate cost for key {key.id}: {estimate}",
+                    context={"key_id": key.id, "provider_id": key.provider_id},
+                )
+                # Fallback to metadata or default cost
+                cost_value = key.metadata.get("estimated_cost_per_request")
+                if cost_value is not None:
+                    try:
+                        costs.append(Decimal(str(cost_value)))
+                    except (ValueError, TypeError, ArithmeticError):
                         costs.append(Decimal("0.01"))
+                else:
+                    costs.append(Decimal("0.01"))
 
             if not costs:
                 # No costs available, return equal scores
@@ -316,61 +342,121 @@ class RoutingEngine:
         filtered_keys: list[APIKey] = []
         filtered_eligible_keys: list[APIKey] = []
 
-        # Query cost estimates and budget checks for each key
-        for key in eligible_keys:
-            try:
-                # Get cost estimate
-                cost_estimate = await self._cost_controller.estimate_request_cost(
-                    request_intent=request_intent_obj,
-                    provider_id=key.provider_id,
-                    key_id=key.id,
-                )
-                cost_estimates[key.id] = cost_estimate
-
-                # Check budget
-                budget_result = await self._cost_controller.check_budget(
-                    request_intent=request_intent_obj,
-                    cost_estimate=cost_estimate,
-                    provider_id=key.provider_id,
-                    key_id=key.id,
-                )
-                budget_results[key.id] = budget_result
+        # Query cost estimates and budget checks for all keys concurrently
+        outcomes = await self._gather_bounded(
+            self._check_key_budget(key, request_intent_obj) for key in eligible_keys
+        )
 
-                # Filter out keys that would exceed budget with hard enforcement
-                if budget_result.would_exceed:
-                    # Check if any violated budgets have hard enforcement
-                    violated_budgets = budget_result.violated_budgets
-                    if violated_budgets:
-                        # Get budget objects to check enforcement mode
-                        from apikeyrouter.domain.models.budget import EnforcementMode
-
-                        has_hard_enforcement = False
-                        for budget_id in violated_budgets:
-                            budget = await self._cost_controller.get_budget(budget_id)
-                            if budget and budget.enforcement_mode == EnforcementMode.Hard:
-                                has_hard_enforcement = True
-                                break
-
-                        if has_hard_enforcement:
-                            # Hard enforcement - filter out this key
-                            filtered_keys.append(key)
-                            continue
-
-                # Keep key (either within budget or soft enforcement)
-                filtered_eligible_keys.append(key)
-            except Exception as e:
+        checked: list[tuple[APIKey, BudgetCheckResult]] = []
+        for key, outcome in zip(eligible_keys, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
                 # If cost estimation or budget check fails, log but don't filter out the key
                 # (graceful degradation)
                 await self._observability.log(
                     level="WARNING",
-                    message=f"Failed to check budget for key {key.id}: {e}",
+                    message=f"Failed to check budget for key {key.id}: {outcome}",
                     context={"key_id": key.id, "provider_id": provider_id},
                 )
-                # Include key without budget check (assume it's OK)
-                filtered_eligible_keys.append(key)
+                continue
+            cost_estimates[key.id], budget_results[key.id] = outcome
+            checked.append((key, outcome[1]))
+
+        # Resolve each violated budget once, no matter how many keys share it
+        budgets = await self._get_budgets(
+            [
+                budget_id
+                for _, budget_result in checked
+                if budget_result.would_exceed
+                for budget_id in budget_result.violated_budgets
+            ]
+        )
+
+        for key in eligible_keys:
+            budget_result = budget_results.get(key.id)
+            # Filter out keys that would exceed budget with hard enforcement
+            if budget_result is not None and budget_result.would_exceed:
+                has_hard_enforcement = any(
+                    (budget := budgets.get(budget_id)) is not None
+                    and budget.enforcement_mode == EnforcementMode.Hard
+                    for budget_id in budget_result.violated_budgets
+                )
+                if has_hard_enforcement:
+                    # Hard enforcement - filter out this key
+                    filtered_keys.append(key)
+                    continue
+
+            # Keep key (within budget, soft enforcement, or budget check failed)
+            filtered_eligible_keys.append(key)
 
         return filtered_eligible_keys, budget_results, cost_estimates, filtered_keys
 
+    async def _check_key_budget(
+        self, key: APIKey, request_intent: RequestIntent
+    ) -> tuple[CostEstimate, BudgetCheckResult]:
+        """Estimate request cost for a key and check it against its budgets.
+
+        Args:
+            key: API key to check.
+            request_intent: RequestIntent for cost estimation.
+
+        Returns:
+            Tuple of (CostEstimate, BudgetCheckResult) for the key.
+
+        Raises:
+            RuntimeError: If no CostController is configured.
+        """
+        if self._cost_controller is None:
+            raise RuntimeError("CostController is not configured")
+        cost_estimate = await self._cost_controller.estimate_request_cost(
+            request_intent=request_intent,
+            provider_id=key.provider_id,
+            key_id=key.id,
+        )
+        budget_result = await self._cost_controller.check_budget(
+            request_intent=request_intent,
+            cost_estimate=cost_estimate,
+            provider_id=key.provider_id,
+            key_id=key.id,
+        )
+        return cost_estimate, budget_result
+
+    async def _get_budgets(self, budget_ids: list[str]) -> dict[str, Budget]:
+        """Fetch budgets by ID concurrently, deduplicating repeated IDs.
+
+        Budgets that cannot be found or fail to load are omitted (and the
+        failure logged), so callers treat them as carrying no enforcement.
+
+        Args:
+            budget_ids: Budget identifiers to fetch (may contain duplicates).
+
+        Returns:
+            Dictionary mapping budget_id to Budget.
+        """
+        unique_ids = list(dict.fromkeys(budget_ids))
+        if not self._cost_controller or not unique_ids:
+            return {}
+
+        results = await self._gather_bounded(
+            self._cost_controller.get_budget(budget_id) for budget_id in unique_ids
+        )
+
+        budgets: dict[str, Budget] = {}
+        for budget_id, result in zip(unique_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                await self._observability.log(
+                    level="WARNING",
+                    message=f"Failed to get budget {budget_id}: {result}",
+                    context={"budget_id": budget_id},
+                )
+                continue
+            if result is not None:
+                budgets[budget_id] = result
+        return budgets
+
     async def _filter_by_quota_state(
         self, eligible_keys: list[APIKey]
     ) -> tuple[list[APIKey], dict[str, QuotaState], list[APIKey]]:
@@ -391,40 +477,101 @@ class RoutingEngine:
         if not self._quota_engine:
             return eligible_keys, {}, []
 
-        quota_states: dict[str, QuotaState] = {}
         filtered_keys: list[APIKey] = []
         filtered_eligible_keys: list[APIKey] = []
 
-        # Query quota state for each key
+        # Query quota states for all keys in one bulk lookup
+        try:
+            quota_states = await self._quota_engine.get_quota_states(
+                [key.id for key in eligible_keys]
+            )
+        except Exception as e:
+            # Bulk lookup failed, fall back to per-key lookups so that one bad
+            # key cannot make every Exhausted/Critical key routable
+            await self._observability.log(
+                level="WARNING",
+                message=(
+                    f"Bulk quota state lookup failed for {len(eligible_keys)} keys, "
+                    f"falling back to per-key lookups: {e}"
+                ),
+                context={"key_ids": [key.id for key in eligible_keys]},
+            )
+            quota_states = await self._get_quota_states_per_key(eligible_keys)
+
         for key in eligible_keys:
-            try:
-                quota_state = await self._quota_engine.get_quota_state(key.id)
-                quota_states[key.id] = quota_state
+            quota_state = quota_states.get(key.id)
+            if quota_state is None:
+                # Include key without quota state (assume it's OK)
+                filtered_eligible_keys.append(key)
+                continue
 
-                # Filter out Exhausted keys
-                if quota_state.capacity_state == CapacityState.Exhausted:
-                    filtered_keys.append(key)
-                    continue
+            # Filter out Exhausted keys
+            if quota_state.capacity_state == CapacityState.Exhausted:
+                filtered_keys.append(key)
+                continue
 
-                # Filter out Critical keys (too risky)
-                if quota_state.capacity_state == CapacityState.Critical:
-                    filtered_keys.append(key)
-                    continue
+            # Filter out Critical keys (too risky)
+            if quota_state.capacity_state == CapacityState.Critical:
+                filtered_keys.append(key)
+                continue
 
-                # Keep keys with Abundant, Constrained, or Recovering states
-                filtered_eligible_keys.append(key)
-            except Exception as e:
-                # If quota state query fails, log but don't filter out the key
-                # (graceful degradation)
+            # Keep keys with Abundant, Constrained, or Recovering states
+            filtered_eligible_keys.append(key)
+
+        return filtered_eligible_keys, quota_states, filtered_keys
+
+    async def _get_quota_states_per_key(self, keys: list[APIKey]) -> dict[str, QuotaState]:
+        """Look up quota states one key at a time (bounded concurrency).
+
+        Keys whose lookup fails are logged and omitted, so callers keep them
+        without quota filtering (graceful degradation).
+
+        Args:
+            keys: API keys to look up.
+
+        Returns:
+            Dictionary mapping key_id to QuotaState for successful lookups.
+        """
+        if self._quota_engine is None:
+            return {}
+
+        results = await self._gather_bounded(
+            self._quota_engine.get_quota_state(key.id) for key in keys
+        )
+
+        quota_states: dict[str, QuotaState] = {}
+        for key, result in zip(keys, results, strict=True):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
                 await self._observability.log(
                     level="WARNING",
-                    message=f"Failed to get quota state for key {key.id}: {e}",
+                    message=f"Failed to get quota state for key {key.id}: {result}",
                     context={"key_id": key.id},
                 )
-                # Include key without quota state (assume it's OK)
-                filtered_eligible_keys.append(key)
+                continue
+            quota_states[key.id] = result
+        return quota_states
 
-        return filtered_eligible_keys, quota_states, filtered_keys
+    async def _gather_bounded(self, coros: Iterable[Awaitable[T]]) -> list[T | BaseException]:
+        """Await coroutines concurrently, capped by max_concurrent_lookups.
+
+        Exceptions are returned in place of results (like
+        ``asyncio.gather(..., return_exceptions=True)``) so callers can degrade
+        per item.
+
+        Args:
+            coros: Awaitables to run.
+
+        Returns:
+            Results (or raised exceptions) in input order.
+        """
+
+        async def run(coro: Awaitable[T]) -> T:
+            async with self._lookup_semaphore:
+                return await coro
+
+        return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=True)
 
     async def _apply_budget_penalties(
         self,
@@ -445,30 +592,32 @@ class RoutingEngine:
         """
         adjusted_scores = scores.copy()
 
+        budgets = await self._get_budgets(
+            [
+                budget_id
+                for key_id, budget_result in budget_results.items()
+                if key_id in adjusted_scores and budget_result.would_exceed
+                for budget_id in budget_result.violated_budgets
+            ]
+        )
+
         for key_id, budget_result in budget_results.items():
-            if key_id not in adjusted_scores:
+            if key_id not in adjusted_scores or not budget_result.would_exceed:
                 continue
 
-            if budget_result.would_exceed:
-                # Check if any violated budgets have soft enforcement
-                violated_budgets = budget_result.violated_budgets
-                if violated_budgets:
-                    from apikeyrouter.domain.models.budget import EnforcementMode
-
-                    has_soft_enforcement = False
-                    if self._cost_controller:
-                        for budget_id in violated_budgets:
-                            budget = await self._cost_controller.get_budget(budget_id)
-                            if budget and budget.enforcement_mode == EnforcementMode.Soft:
-                                has_soft_enforcement = True
-                                break
-
-                    if has_soft_enforcement and self._cost_controller:
-                        # Soft enforcement - penalize score by 30%
-                        base_score = adjusted_scores[key_id]
-                        adjusted_scores[key_id] = base_score * 0.7
-                        # Ensure score stays in valid range
-                        adjusted_scores[key_id] = max(0.0, min(1.0, adjusted_scores[key_id]))
+            # Check if any violated budgets have soft enforcement
+            has_soft_enforcement = any(
+                (budget := budgets.get(budget_id)) is not None
+                and budget.enforcement_mode == EnforcementMode.Soft
+                for budget_id in budget_result.violated_budgets
+            )
+
+            if has_soft_enforcement:
+                # Soft enforcement - penalize score by 30%
+                base_score = adjusted_scores[key_id]
+                adjusted_scores[key_id] = base_score * 0.7
+                # Ensure score stays in valid range
+                adjusted_scores[key_id] = max(0.0, min(1.0, adjusted_scores[key_id]))
 
         return adjusted_scores
 
@@ -1233,8 +1382,6 @@ class RoutingEngine:
             selected_budget_check = budget_results[selected_key.id]
             if selected_budget_check.would_exceed:
                 # Check if hard enforcement would reject this
-                from apikeyrouter.domain.models.budget import EnforcementMode
-
                 violated_budgets = selected_budget_check.violated_budgets
                 for budget_id in violated_budgets:
                     budget = await self._cost_controller.get_budget(budget_id)
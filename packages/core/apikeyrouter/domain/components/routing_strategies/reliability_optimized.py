@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from apikeyrouter.domain.components.quota_awareness_engine import QuotaAwarenessEngine
 from apikeyrouter.domain.interfaces.observability_manager import ObservabilityManager
 from apikeyrouter.domain.interfaces.provider_adapter import ProviderAdapter
@@ -140,17 +142,22 @@ class ReliabilityOptimizedStrategy:
         # Get quota states if not provided
         if quota_states is None and self._quota_engine:
             quota_states = {}
-            for key in eligible_keys:
-                try:
-                    key_quota_state = await self._quota_engine.get_quota_state(key.id)
-                    quota_states[key.id] = key_quota_state
-                except Exception as e:
+            results = await asyncio.gather(
+                *(self._quota_engine.get_quota_state(key.id) for key in eligible_keys),
+                return_exceptions=True,
+            )
+            for key, result in zip(eligible_keys, results, strict=True):
+                if isinstance(result, BaseException):
+                    if not isinstance(result, Exception):
+                        raise result
                     # Log but continue without quota state for this key
                     await self._observability.log(
                         level="WARNING",
-                        message=f"Failed to get quota state for key {key.id}: {e}",
+                        message=f"Failed to get quota state for key {key.id}: {result}",
                         context={"key_id": key.id},
                     )
+                    continue
+                quota_states[key.id] = result
 
         # Score each key
         for key in eligible_keys:
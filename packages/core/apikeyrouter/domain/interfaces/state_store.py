@@ -25,6 +25,7 @@ Example:
     ```
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any
@@ -299,6 +300,43 @@ class StateStore(ABC):
         """
         pass
 
+    async def get_quota_states(self, key_ids: list[str]) -> dict[str, QuotaState]:
+        """Retrieve QuotaStates for several keys in one call.
+
+        Bulk counterpart to get_quota_state() used on the routing hot path.
+        The default implementation fans out concurrent get_quota_state()
+        calls; backends that support batched reads (Redis MGET, MongoDB
+        ``$in``) should override it to serve the lookup in a single round trip.
+
+        Args:
+            key_ids: Unique identifiers of the keys to look up. Duplicates are
+                     ignored.
+
+        Returns:
+            Dictionary mapping key_id to QuotaState. Keys without a stored
+            quota state are omitted.
+
+        Raises:
+            StateStoreError: If retrieval operation fails (e.g., connection error).
+
+        Example:
+            ```python
+            states = await store.get_quota_states(["key1", "key2"])
+            for key_id, quota in states.items():
+                print(f"{key_id}: {quota.capacity_state}")
+            ```
+        """
+        unique_ids = list(dict.fromkeys(key_ids))
+        if not unique_ids:
+            return {}
+
+        results = await asyncio.gather(*(self.get_quota_state(key_id) for key_id in unique_ids))
+        return {
+            key_id: state
+            for key_id, state in zip(unique_ids, results, strict=True)
+            if state is not None
+        }
+
     @abstractmethod
     async def save_routing_decision(self, decision: RoutingDecision) -> None:
         """Save a routing decision to the audit trail.
@@ -56,6 +56,21 @@ class OpenAIAdapter(ProviderAdapter):  # type: ignore[misc]
     HEALTH_CHECK_TTL = 30.0
     """Health status cache TTL in seconds."""
 
+    CONNECT_TIMEOUT = 5.0
+    """Connection establishment timeout in seconds."""
+
+    POOL_TIMEOUT = 5.0
+    """Timeout in seconds for acquiring a connection from the pool."""
+
+    MAX_CONNECTIONS = 100
+    """Maximum number of concurrent connections in the pool."""
+
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    """Maximum number of idle keep-alive connections kept in the pool."""
+
+    KEEPALIVE_EXPIRY = 30.0
+    """Seconds an idle keep-alive connection is kept before being closed."""
+
     # OpenAI pricing per 1K tokens (as of 2024, approximate - should be updated from official pricing)
     # Format: {model_name: {"input": price_per_1k, "output": price_per_1k}}
     PRICING: dict[str, dict[str, Decimal]] = {
@@ -102,20 +117,87 @@ class OpenAIAdapter(ProviderAdapter):  # type: ignore[misc]
         base_url: str | None = None,
         timeout: float | None = None,
         health_check_ttl: float | None = None,
+        connect_timeout: float | None = None,
+        pool_timeout: float | None = None,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry: float | None = None,
+        http2: bool = False,
     ) -> None:
         """Initialize OpenAI adapter.
 
+        The adapter owns a single pooled ``httpx.AsyncClient`` that is created on
+        first use and reused for all requests, so connections (and their TLS
+        sessions) are kept alive between calls. Call ``close()`` when the adapter
+        is no longer needed.
+
         Args:
             base_url: Optional base URL override (for testing).
-            timeout: Optional timeout override (for testing).
+            timeout: Optional timeout override (for testing). Used as the read
+                and write timeout of each request.
             health_check_ttl: Optional health check cache TTL override (for testing).
+            connect_timeout: Optional connection establishment timeout override.
+            pool_timeout: Optional timeout override for acquiring a pooled connection.
+            max_connections: Optional maximum number of pooled connections.
+            max_keepalive_connections: Optional maximum number of idle keep-alive
+                connections.
+            keepalive_expiry: Optional idle keep-alive connection expiry in seconds.
+            http2: Enable HTTP/2. Requires the ``h2`` package
+                (``pip install httpx[http2]``).
         """
         self.base_url = base_url or self.BASE_URL
         self.timeout = timeout or self.TIMEOUT
         self.health_check_ttl = health_check_ttl or self.HEALTH_CHECK_TTL
+        self.connect_timeout = connect_timeout or self.CONNECT_TIMEOUT
+        self.pool_timeout = pool_timeout or self.POOL_TIMEOUT
+        self.max_connections = max_connections or self.MAX_CONNECTIONS
+        self.max_keepalive_connections = (
+            max_keepalive_connections
+            if max_keepalive_connections is not None
+            else self.MAX_KEEPALIVE_CONNECTIONS
+        )
+        self.keepalive_expiry = (
+            keepalive_expiry if keepalive_expiry is not None else self.KEEPALIVE_EXPIRY
+        )
+        self.http2 = http2
+        self._client: httpx.AsyncClient | None = None
+        """Shared pooled HTTP client, created lazily on first use."""
         self._health_cache: dict[str, tuple[HealthState, float]] = {}
         """Health status cache: {cache_key: (HealthState, timestamp)}"""
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get the shared pooled HTTP client, creating it if needed.
+
+        Returns:
+            The adapter's long-lived httpx.AsyncClient.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(
+                    self.timeout,
+                    connect=self.connect_timeout,
+                    pool=self.pool_timeout,
+                ),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                http2=self.http2,
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client and release pooled connections.
+
+        Safe to call more than once. A new client is created if the adapter
+        is used again afterwards.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def execute_request(
         self,
         intent: RequestIntent,
@@ -152,17 +234,16 @@ class OpenAIAdapter(ProviderAdapter):  # type: ignore[misc]
 
         # Make HTTP request
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    json=openai_request,
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json",
-                    },
-                )
-                response.raise_for_status()
-                response_data = response.json()
+            response = await self.client.post(
+                f"{self.base_url}/chat/completions",
+                json=openai_request,
+                headers={
+                    "Authorization": f"Bearer {api_key}",
+                    "Content-Type": "application/json",
+                },
+            )
+            response.raise_for_status()
+            response_data = response.json()
 
         except httpx.HTTPStatusError as e:
             # Map HTTP status errors to SystemError
@@ -637,35 +718,35 @@ class OpenAIAdapter(ProviderAdapter):  # type: ignore[misc]
         # Perform health check
         start_time = time.time()
         try:
-            async with httpx.AsyncClient(timeout=self.HEALTH_CHECK_TIMEOUT) as client:
-                # Use lightweight models endpoint for health check
-                response = await client.get(
-                    f"{self.base_url}/models",
-                    headers={"Content-Type": "application/json"},
-                )
+            # Use lightweight models endpoint for health check
+            response = await self.client.get(
+                f"{self.base_url}/models",
+                headers={"Content-Type": "application/json"},
+                timeout=self.HEALTH_CHECK_TIMEOUT,
+            )
 
-                latency_ms = int((time.time() - start_time) * 1000)
+            latency_ms = int((time.time() - start_time) * 1000)
 
-                # Determine health status based on response
-                if response.status_code == 200:
-                    status = HealthStatus.Healthy
-                elif response.status_code == 429:
-                    status = HealthStatus.Degraded
-                elif response.status_code >= 500:
-                    status = HealthStatus.Down
-                else:
-                    # Other 4xx errors - treat as degraded
-                    status = HealthStatus.Degraded
-
-                health_state = HealthState(
-                    status=status,
-                    last_check=datetime.utcnow(),
-                    latency_ms=latency_ms,
-                    details={
-                        "status_code": response.status_code,
-                        "endpoint": "/models",
-                    },
-                )
+            # Determine health status based on response
+            if response.status_code == 200:
+                status = HealthStatus.Healthy
+            elif response.status_code == 429:
+                status = HealthStatus.Degraded
+            elif response.status_code >= 500:
+                status = HealthStatus.Down
+            else:
+                # Other 4xx errors - treat as degraded
+                status = HealthStatus.Degraded
+
+            health_state = HealthState(
+                status=status,
+                last_check=datetime.utcnow(),
+                latency_ms=latency_ms,
+                details={
+                    "status_code": response.status_code,
+                    "endpoint": "/models",
+                },
+            )
 
         except httpx.TimeoutException:
             # Timeout - provider is down
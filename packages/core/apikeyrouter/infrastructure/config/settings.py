@@ -47,6 +47,12 @@ class RouterSettings(BaseSettings):
         default=60,
         description="Default cooldown period for Throttled state in seconds",
     )
+    key_index_refresh_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        description="Maximum age of the in-process eligible-key index before it is "
+        "resynced from the StateStore",
+    )
 
     # QuotaAwarenessEngine configuration
     quota_default_cooldown_seconds: int = Field(
@@ -54,6 +60,13 @@ class RouterSettings(BaseSettings):
         description="Default cooldown period when retry-after is missing",
     )
 
+    # RoutingEngine configuration
+    routing_max_concurrent_lookups: int = Field(
+        default=16,
+        ge=1,
+        description="Maximum per-key cost, budget and quota lookups in flight per routing decision",
+    )
+
     # Observability configuration
     log_level: str = Field(
         default="INFO",
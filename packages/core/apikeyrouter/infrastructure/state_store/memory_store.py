@@ -243,6 +243,30 @@ class InMemoryStateStore(StateStore):  # type: ignore[misc]
         except Exception as e:
             raise StateStoreError(f"Failed to get quota state for key {key_id}: {e}") from e
 
+    async def get_quota_states(self, key_ids: list[str]) -> dict[str, QuotaState]:
+        """Retrieve QuotaStates for several keys in one call.
+
+        Serves all lookups from the in-memory dictionary in a single pass.
+        Keys without a stored quota state are omitted from the result.
+
+        Args:
+            key_ids: Unique identifiers of the keys to look up.
+
+        Returns:
+            Dictionary mapping key_id to QuotaState.
+
+        Raises:
+            StateStoreError: If retrieval operation fails.
+        """
+        try:
+            return {
+                key_id: self._quota_states[key_id]
+                for key_id in key_ids
+                if key_id in self._quota_states
+            }
+        except Exception as e:
+            raise StateStoreError(f"Failed to get quota states: {e}") from e
+
     async def save_routing_decision(self, decision: RoutingDecision) -> None:
         """Save a routing decision to the audit trail.
 
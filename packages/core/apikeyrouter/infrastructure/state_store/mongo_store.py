@@ -376,6 +376,36 @@ class MongoStateStore(StateStore):  # type: ignore[misc]
             logger.error("mongodb_get_quota_error", key_id=key_id, error=error_msg)
             raise StateStoreError(error_msg) from e
 
+    async def get_quota_states(self, key_ids: list[str]) -> dict[str, QuotaState]:
+        """Retrieve QuotaStates for several keys from MongoDB in one query.
+
+        Uses a single ``$in`` query over the key_id unique index instead of one
+        find_one() per key. Keys without a stored quota state are omitted.
+
+        Args:
+            key_ids: Unique identifiers of the keys to look up.
+
+        Returns:
+            Dictionary mapping key_id to QuotaState.
+
+        Raises:
+            StateStoreError: If retrieval operation fails.
+        """
+        unique_ids = list(dict.fromkeys(key_ids))
+        if not unique_ids:
+            return {}
+
+        if not self._initialized:
+            await self.initialize()
+
+        try:
+            docs = await QuotaStateDocument.find({"key_id": {"$in": unique_ids}}).to_list()
+            return {doc.key_id: doc.to_domain_model() for doc in docs}
+        except Exception as e:
+            error_msg = f"Failed to get quota states: {e}"
+            logger.error("mongodb_get_quotas_error", key_count=len(unique_ids), error=error_msg)
+            raise StateStoreError(error_msg) from e
+
     async def save_routing_decision(self, decision: RoutingDecision) -> None:
         """Save a routing decision to MongoDB using Beanie.
 
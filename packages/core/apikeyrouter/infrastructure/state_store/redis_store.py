@@ -438,6 +438,66 @@ class RedisStateStore(StateStore):  # type: ignore[misc]
         except Exception as e:
             raise StateStoreError(f"Failed to get quota state for key {key_id}: {e}") from e
 
+    async def get_quota_states(self, key_ids: list[str]) -> dict[str, QuotaState]:
+        """Retrieve QuotaStates for several keys in one round trip.
+
+        Issues a single MGET over the quota keys instead of one GET per key.
+        Keys without a stored quota state, or whose stored value cannot be
+        decoded, are omitted from the result.
+
+        Args:
+            key_ids: Unique identifiers of the keys to look up.
+
+        Returns:
+            Dictionary mapping key_id to QuotaState.
+
+        Raises:
+            StateStoreError: If retrieval operation fails.
+
+        Example:
+            ```python
+            states = await store.get_quota_states(["key1", "key2"])
+            ```
+        """
+        unique_ids = list(dict.fromkeys(key_ids))
+        if not unique_ids:
+            return {}
+
+        await self._ensure_connection()
+
+        if self._use_fallback:
+            return await self._fallback_store.get_quota_states(unique_ids)
+
+        try:
+            if self._redis is None:
+                raise StateStoreError("Redis connection not available")
+            redis_keys = [KEY_PATTERN_QUOTA.format(key_id=key_id) for key_id in unique_ids]
+            values = await self._redis.mget(redis_keys)
+            states: dict[str, QuotaState] = {}
+            for key_id, state_json in zip(unique_ids, values, strict=True):
+                if state_json is None:
+                    continue
+                try:
+                    states[key_id] = QuotaState(**json.loads(state_json))
+                except (ValueError, TypeError) as e:
+                    # One corrupt value must not fail the whole batch
+                    logger.warning(
+                        "Skipping undecodable quota state in Redis",
+                        key_id=key_id,
+                        error=str(e),
+                    )
+            return states
+        except (ConnectionError, TimeoutError, RedisError) as e:
+            logger.warning(
+                "Failed to get quota states from Redis, using fallback",
+                key_count=len(unique_ids),
+                error=str(e),
+            )
+            self._use_fallback = True
+            return await self._fallback_store.get_quota_states(unique_ids)
+        except Exception as e:
+            raise StateStoreError(f"Failed to get quota states: {e}") from e
+
     async def save_routing_decision(self, decision: RoutingDecision) -> None:
         """Save a routing decision to the audit trail.
 
@@ -1,5 +1,6 @@
 """ApiKeyRouter - Main orchestrator for intelligent API key routing."""
 
+import inspect
 import uuid
 from datetime import datetime
 from typing import Any
@@ -125,6 +126,7 @@ class ApiKeyRouter:
             state_store=self._state_store,
             observability_manager=self._observability_manager,
             default_cooldown_seconds=self._config.default_cooldown_seconds,
+            index_refresh_seconds=self._config.key_index_refresh_seconds,
         )
 
         # Initialize QuotaAwarenessEngine
@@ -151,6 +153,7 @@ class ApiKeyRouter:
             observability_manager=self._observability_manager,
             quota_awareness_engine=self._quota_awareness_engine,
             providers=self._providers,
+            max_concurrent_lookups=self._config.routing_max_concurrent_lookups,
         )
 
     async def __aenter__(self) -> "ApiKeyRouter":
@@ -183,9 +186,31 @@ class ApiKeyRouter:
             exc_val: Exception value if any.
             exc_tb: Exception traceback if any.
         """
-        # Perform any async cleanup if needed
-        # Currently, no cleanup required
-        pass
+        await self.close()
+
+    async def close(self) -> None:
+        """Release resources held by registered provider adapters.
+
+        Closes the pooled HTTP clients owned by provider adapters that expose
+        an async ``close()`` method (e.g. OpenAIAdapter). Called automatically
+        by ``__aexit__``; call it explicitly when not using ``async with``.
+        A failure closing one adapter is logged and does not prevent the
+        others from being closed.
+        """
+        for provider_id, adapter in self._providers.items():
+            close = getattr(adapter, "close", None)
+            if close is None or not callable(close):
+                continue
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                await self._observability_manager.log(
+                    level="WARNING",
+                    message="Failed to close provider adapter",
+                    context={"provider_id": provider_id, "error": str(e)},
+                )
 
     @property
     def key_manager(self) -> KeyManager:
@@ -728,7 +753,7 @@ class ApiKeyRouter:
                 # Update key usage statistics
                 api_key.usage_count += 1
                 api_key.last_used_at = datetime.utcnow()
-                await self._state_store.save_key(api_key)
+                await self._key_manager.update_key(api_key)
 
                 # Calculate response time
                 response_time_ms = (
@@ -800,7 +825,7 @@ class ApiKeyRouter:
                 )
                 # Update key failure count
                 api_key.failure_count += 1
-                await self._state_store.save_key(api_key)
+                await self._key_manager.update_key(api_key)
 
                 # Emit error event
                 await self._observability_manager.emit_event(
@@ -132,6 +132,41 @@ async def test_get_quota_state_returns_none_for_nonexistent_key(
     assert retrieved is None
 
 
+@pytest.mark.asyncio
+async def test_get_quota_states_retrieves_in_bulk(mongo_store: MongoStateStore):
+    """Test that get_quota_states omits missing keys and ignores duplicate IDs."""
+    # Arrange
+    for i, value in enumerate((100, 200)):
+        await mongo_store.save_quota_state(
+            QuotaState(
+                id=f"quota-bulk-{i}",
+                key_id=f"bulk-key-{i}",
+                remaining_capacity=CapacityEstimate(value=value),
+                reset_at=datetime.utcnow() + timedelta(days=1),
+            )
+        )
+
+    # Act
+    states = await mongo_store.get_quota_states(
+        ["bulk-key-0", "bulk-key-1", "bulk-key-0", "nonexistent-key-id"]
+    )
+
+    # Assert
+    assert set(states) == {"bulk-key-0", "bulk-key-1"}
+    assert states["bulk-key-0"].id == "quota-bulk-0"
+    assert states["bulk-key-1"].remaining_capacity.value == 200
+
+
+@pytest.mark.asyncio
+async def test_get_quota_states_returns_empty_for_no_keys(mongo_store: MongoStateStore):
+    """Test that get_quota_states returns an empty dict for an empty input."""
+    # Act
+    states = await mongo_store.get_quota_states([])
+
+    # Assert
+    assert states == {}
+
+
 @pytest.mark.asyncio
 async def test_save_quota_state_upserts_existing_state(mongo_store: MongoStateStore):
     """Test that save_quota_state updates existing state (upsert behavior)."""
@@ -286,6 +286,76 @@ class TestOpenAIAdapterExecuteRequest:
             assert exc_info.value.retryable is True
 
 
+class TestOpenAIAdapterConnectionPooling:
+    """Tests for the adapter's shared pooled HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_execute_request_reuses_client(
+        self,
+        openai_adapter: OpenAIAdapter,
+        api_key: APIKey,
+        request_intent: RequestIntent,
+    ) -> None:
+        """Test that consecutive requests share one client instead of opening new ones."""
+        mock_response = {
+            "id": "chatcmpl-123",
+            "choices": [{"message": {"content": "test"}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1},
+        }
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.is_closed = False
+            mock_response_obj = MagicMock()
+            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.raise_for_status = MagicMock()
+            mock_client.post = AsyncMock(return_value=mock_response_obj)
+            mock_client_class.return_value = mock_client
+
+            for _ in range(3):
+                await openai_adapter.execute_request(request_intent, api_key)
+
+            mock_client_class.assert_called_once()
+            assert mock_client.post.call_count == 3
+
+    def test_client_uses_configured_limits_and_timeouts(self) -> None:
+        """Test that pool limits, keep-alive and per-phase timeouts are applied."""
+        adapter = OpenAIAdapter(
+            timeout=12.0,
+            connect_timeout=2.0,
+            pool_timeout=1.0,
+            max_connections=7,
+            max_keepalive_connections=3,
+            keepalive_expiry=9.0,
+        )
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            _ = adapter.client
+
+        kwargs = mock_client_class.call_args.kwargs
+        assert kwargs["timeout"] == httpx.Timeout(12.0, connect=2.0, pool=1.0)
+        assert kwargs["limits"] == httpx.Limits(
+            max_connections=7, max_keepalive_connections=3, keepalive_expiry=9.0
+        )
+        assert kwargs["http2"] is False
+
+    @pytest.mark.asyncio
+    async def test_close_releases_client(self, openai_adapter: OpenAIAdapter) -> None:
+        """Test that close() closes the client and a new one is created on next use."""
+        first_client = openai_adapter.client
+        assert openai_adapter.client is first_client
+
+        await openai_adapter.close()
+        assert first_client.is_closed
+
+        # Closing again is a no-op
+        await openai_adapter.close()
+
+        second_client = openai_adapter.client
+        assert second_client is not first_client
+        await openai_adapter.close()
+
+
 class TestOpenAIAdapterNormalizeResponse:
     """Tests for normalize_response method."""
 
@@ -346,6 +346,78 @@ async def test_get_quota_state_returns_none_when_not_found(redis_store: RedisSta
     assert retrieved_quota is None
 
 
+@pytest.mark.asyncio
+async def test_get_quota_states_retrieves_in_bulk(redis_store: RedisStateStore):
+    """Test that get_quota_states omits missing keys and ignores duplicate IDs."""
+    # Arrange
+    for i, value in enumerate((100, 200)):
+        await redis_store.save_quota_state(
+            QuotaState(
+                id=f"quota-bulk-{i}",
+                key_id=f"bulk-key-{i}",
+                remaining_capacity=CapacityEstimate(value=value),
+                reset_at=datetime.utcnow() + timedelta(days=1),
+            )
+        )
+
+    # Act
+    states = await redis_store.get_quota_states(
+        ["bulk-key-0", "bulk-key-1", "bulk-key-0", "non-existent-key"]
+    )
+
+    # Assert
+    assert set(states) == {"bulk-key-0", "bulk-key-1"}
+    assert states["bulk-key-0"].remaining_capacity.value == 100
+    assert states["bulk-key-1"].remaining_capacity.value == 200
+
+
+@pytest.mark.asyncio
+async def test_get_quota_states_skips_undecodable_values(redis_store: RedisStateStore):
+    """Test that one corrupt quota value does not fail the whole batch."""
+    # Arrange
+    await redis_store.save_quota_state(
+        QuotaState(
+            id="quota-good",
+            key_id="good-key",
+            remaining_capacity=CapacityEstimate(value=100),
+            reset_at=datetime.utcnow() + timedelta(days=1),
+        )
+    )
+    if redis_store._redis:
+        await redis_store._redis.set("quota:corrupt-key", "{not json")
+
+    # Act
+    states = await redis_store.get_quota_states(["good-key", "corrupt-key"])
+
+    # Assert
+    assert set(states) == {"good-key"}
+
+
+@pytest.mark.asyncio
+async def test_get_quota_states_falls_back_on_connection_error(redis_store: RedisStateStore):
+    """Test that get_quota_states switches to the fallback store on connection errors."""
+    # Arrange
+    quota_state = QuotaState(
+        id="quota-fallback",
+        key_id="fallback-key",
+        remaining_capacity=CapacityEstimate(value=300),
+        reset_at=datetime.utcnow() + timedelta(days=1),
+    )
+    await redis_store._fallback_store.save_quota_state(quota_state)
+
+    if redis_store._redis:
+        with patch.object(
+            redis_store._redis, "mget", side_effect=ConnectionError("Connection failed")
+        ):
+            # Act
+            states = await redis_store.get_quota_states(["fallback-key", "missing-key"])
+
+            # Assert
+            assert redis_store._use_fallback is True
+            assert set(states) == {"fallback-key"}
+            assert states["fallback-key"].remaining_capacity.value == 300
+
+
 @pytest.mark.asyncio
 async def test_save_routing_decision_stores_in_redis(redis_store: RedisStateStore):
     """Test that save_routing_decision stores RoutingDecision in Redis."""
@@ -982,6 +982,165 @@ class TestKeyManagerEligibilityFiltering:
         assert len(eligible) == 80  # 100 - 20 disabled
         assert elapsed < 5.0, f"Filtering took {elapsed:.2f}ms, expected <5ms"
 
+    @pytest.mark.asyncio
+    async def test_get_eligible_keys_does_not_query_store_after_first_load(self) -> None:
+        """Test that eligibility lookups are served from the in-process index."""
+        key = await self.key_manager.register_key(
+            key_material="sk-indexed-key",
+            provider_id="openai",
+        )
+
+        list_calls = 0
+        original_list_keys = self.state_store.list_keys
+
+        async def counting_list_keys(provider_id: str | None = None) -> list[APIKey]:
+            nonlocal list_calls
+            list_calls += 1
+            return await original_list_keys(provider_id)
+
+        self.state_store.list_keys = counting_list_keys  # type: ignore[method-assign]
+
+        for _ in range(5):
+            eligible = await self.key_manager.get_eligible_keys(provider_id="openai")
+            assert [k.id for k in eligible] == [key.id]
+
+        assert list_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_get_eligible_keys_loads_keys_already_in_store(self) -> None:
+        """Test that keys persisted before KeyManager started are picked up."""
+        stored_key = APIKey(
+            id="preexisting-key",
+            key_material="encrypted",
+            provider_id="openai",
+        )
+        await self.state_store.save_key(stored_key)
+
+        eligible = await self.key_manager.get_eligible_keys(provider_id="openai")
+
+        assert [k.id for k in eligible] == ["preexisting-key"]
+
+    @pytest.mark.asyncio
+    async def test_get_eligible_keys_tracks_state_transitions(self) -> None:
+        """Test that the index follows state transitions without a store scan."""
+        key1 = await self.key_manager.register_key(
+            key_material="sk-test-key-1",
+            provider_id="openai",
+        )
+        key2 = await self.key_manager.register_key(
+            key_material="sk-test-key-2",
+            provider_id="openai",
+        )
+        await self.key_manager.get_eligible_keys(provider_id="openai")
+
+        await self.key_manager.update_key_state(
+            key_id=key1.id, new_state=KeyState.Exhausted, reason="quota_exhausted"
+        )
+        eligible = await self.key_manager.get_eligible_keys(provider_id="openai")
+        assert [k.id for k in eligible] == [key2.id]
+
+        await self.key_manager.update_key_state(
+            key_id=key1.id, new_state=KeyState.Recovering, reason="quota_reset"
+        )
+        eligible = await self.key_manager.get_eligible_keys(provider_id="openai")
+        # Original registration order is preserved
+        assert [k.id for k in eligible] == [key1.id, key2.id]
+
+    @pytest.mark.asyncio
+    async def test_get_eligible_keys_promotes_throttled_keys_in_cooldown_order(self) -> None:
+        """Test that throttled keys become eligible as their cooldowns expire."""
+        from datetime import datetime, timedelta
+        from unittest.mock import patch
+
+        short = await self.key_manager.register_key(
+            key_material="sk-short-cooldown",
+            provider_id="openai",
+        )
+        long = await self.key_manager.register_key(
+            key_material="sk-long-cooldown",
+            provider_id="openai",
+        )
+        await self.key_manager.update_key_state(
+            key_id=long.id, new_state=KeyState.Throttled, reason="rate_limit", cooldown_seconds=120
+        )
+        await self.key_manager.update_key_state(
+            key_id=short.id, new_state=KeyState.Throttled, reason="rate_limit", cooldown_seconds=30
+        )
+
+        assert await self.key_manager.get_eligible_keys(provider_id="openai") == []
+
+        now = datetime.utcnow()
+        with patch("apikeyrouter.domain.components.key_manager.datetime") as mock_datetime:
+            mock_datetime.utcnow.return_value = now + timedelta(seconds=60)
+            eligible = await self.key_manager.get_eligible_keys(provider_id="openai")
+            assert [k.id for k in eligible] == [short.id]
+
+            mock_datetime.utcnow.return_value = now + timedelta(seconds=180)
+            eligible = await self.key_manager.get_eligible_keys(provider_id="openai")
+            assert [k.id for k in eligible] == [short.id, long.id]
+
+    @pytest.mark.asyncio
+    async def test_check_and_recover_states_resyncs_index(self) -> None:
+        """Test that the periodic recovery pass picks up out-of-band store writes."""
+        await self.key_manager.get_eligible_keys(provider_id="openai")
+
+        # Written to the store by another process
+        await self.state_store.save_key(
+            APIKey(id="external-key", key_material="encrypted", provider_id="openai")
+        )
+        assert await self.key_manager.get_eligible_keys(provider_id="openai") == []
+
+        await self.key_manager.check_and_recover_states()
+
+        eligible = await self.key_manager.get_eligible_keys(provider_id="openai")
+        assert [k.id for k in eligible] == ["external-key"]
+
+    @pytest.mark.asyncio
+    async def test_get_eligible_keys_resyncs_stale_index(self) -> None:
+        """Test that the index is reloaded once older than index_refresh_seconds."""
+        import time
+        from unittest.mock import patch
+
+        key_manager = KeyManager(
+            state_store=self.state_store,
+            observability_manager=self.observability,
+            index_refresh_seconds=30.0,
+        )
+        key = await key_manager.register_key(
+            key_material="sk-shared-key",
+            provider_id="openai",
+        )
+        assert [k.id for k in await key_manager.get_eligible_keys(provider_id="openai")] == [
+            key.id
+        ]
+
+        # Another process disables the key and adds a new one in the shared store
+        disabled = key.model_copy(update={"state": KeyState.Disabled})
+        await self.state_store.save_key(disabled)
+        await self.state_store.save_key(
+            APIKey(id="external-key", key_material="encrypted", provider_id="openai")
+        )
+
+        # Within the refresh interval the index is served as is
+        eligible = await key_manager.get_eligible_keys(provider_id="openai")
+        assert [k.id for k in eligible] == [key.id]
+
+        now = time.monotonic()
+        with patch("apikeyrouter.domain.components.key_manager.time") as mock_time:
+            mock_time.monotonic.return_value = now + 31.0
+            eligible = await key_manager.get_eligible_keys(provider_id="openai")
+
+        assert [k.id for k in eligible] == ["external-key"]
+
+    def test_rejects_negative_index_refresh_seconds(self) -> None:
+        """Test that index_refresh_seconds must be non-negative."""
+        with pytest.raises(ValueError, match="index_refresh_seconds"):
+            KeyManager(
+                state_store=self.state_store,
+                observability_manager=self.observability,
+                index_refresh_seconds=-1.0,
+            )
+
 
 class TestKeyManagerRevocationAndRotation:
     """Tests for KeyManager revocation and rotation functionality."""
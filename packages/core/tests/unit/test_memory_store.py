@@ -306,6 +306,33 @@ class TestInMemoryStateStoreOtherMethods:
 
         assert retrieved is None
 
+    @pytest.mark.asyncio
+    async def test_get_quota_states_retrieves_in_bulk(self) -> None:
+        """Test that get_quota_states returns stored states and omits missing ones."""
+        store = InMemoryStateStore()
+        for i in range(3):
+            await store.save_quota_state(
+                QuotaState(
+                    id=f"quota{i}",
+                    key_id=f"key{i}",
+                    remaining_capacity=CapacityEstimate(value=1000 * (i + 1)),
+                    reset_at=datetime.utcnow() + timedelta(days=1),
+                )
+            )
+
+        retrieved = await store.get_quota_states(["key0", "key2", "missing"])
+
+        assert set(retrieved) == {"key0", "key2"}
+        assert retrieved["key0"].remaining_capacity.value == 1000
+        assert retrieved["key2"].remaining_capacity.value == 3000
+
+    @pytest.mark.asyncio
+    async def test_get_quota_states_empty_input(self) -> None:
+        """Test that get_quota_states returns an empty dict for no key IDs."""
+        store = InMemoryStateStore()
+
+        assert await store.get_quota_states([]) == {}
+
     @pytest.mark.asyncio
     async def test_save_quota_state_overwrites_existing(self) -> None:
         """Test that save_quota_state overwrites existing state."""
@@ -721,6 +721,56 @@ class TestQuotaAwarenessEngine:
         result_key_ids = {result.key_id for result in results}
         assert result_key_ids == set(key_ids)
 
+    @pytest.mark.asyncio
+    async def test_get_quota_states_bulk(
+        self, engine: QuotaAwarenessEngine, mock_state_store: MockStateStore
+    ) -> None:
+        """Test get_quota_states returns stored states and initializes missing ones."""
+        existing = QuotaState(
+            id=str(uuid.uuid4()),
+            key_id="bulk_key_existing",
+            total_capacity=100,
+            remaining_capacity=CapacityEstimate(value=40),
+            reset_at=datetime.utcnow() + timedelta(hours=1),
+        )
+        await mock_state_store.save_quota_state(existing)
+        mock_state_store.save_quota_state_called = False
+
+        results = await engine.get_quota_states(["bulk_key_existing", "bulk_key_new"])
+
+        assert set(results) == {"bulk_key_existing", "bulk_key_new"}
+        assert results["bulk_key_existing"].remaining_capacity.value == 40
+        assert results["bulk_key_new"].capacity_state == CapacityState.Abundant
+        # Only the missing key should have been initialized and saved
+        assert mock_state_store.save_quota_state_called
+        assert "bulk_key_new" in mock_state_store._quota_states
+
+    @pytest.mark.asyncio
+    async def test_get_quota_states_omits_keys_that_fail_to_initialize(
+        self,
+        engine: QuotaAwarenessEngine,
+        mock_state_store: MockStateStore,
+        mock_observability: MockObservabilityManager,
+    ) -> None:
+        """Test get_quota_states omits keys whose initialization fails."""
+        existing = QuotaState(
+            id=str(uuid.uuid4()),
+            key_id="bulk_key_existing",
+            total_capacity=100,
+            remaining_capacity=CapacityEstimate(value=40),
+            reset_at=datetime.utcnow() + timedelta(hours=1),
+        )
+        await mock_state_store.save_quota_state(existing)
+        mock_state_store.save_quota_state_error = StateStoreError("write failed")
+
+        results = await engine.get_quota_states(["bulk_key_existing", "bulk_key_new"])
+
+        assert set(results) == {"bulk_key_existing"}
+        assert any(
+            "Failed to initialize quota state for key bulk_key_new" in log["message"]
+            for log in mock_observability.logs
+        )
+
     @pytest.mark.asyncio
     async def test_get_quota_state_performance(
         self, engine: QuotaAwarenessEngine, mock_state_store: MockStateStore
@@ -228,6 +228,19 @@ class TestApiKeyRouterInitialization:
             assert router._key_manager is not None
             assert router._routing_engine is not None
 
+    @pytest.mark.asyncio
+    async def test_router_closes_provider_adapters_on_exit(self) -> None:
+        """Test that leaving the async context closes provider adapters."""
+        from unittest.mock import AsyncMock
+
+        adapter = MockProviderAdapter()
+        adapter.close = AsyncMock()  # type: ignore[attr-defined]
+
+        async with ApiKeyRouter() as router:
+            await router.register_provider("test_provider", adapter)
+
+        adapter.close.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_router_properties_expose_components(self) -> None:
         """Test that router properties expose component instances."""
@@ -262,15 +275,21 @@ class TestApiKeyRouterInitialization:
         config_dict = {
             "default_cooldown_seconds": 180,
             "quota_default_cooldown_seconds": 240,
+            "routing_max_concurrent_lookups": 4,
+            "key_index_refresh_seconds": 2.5,
         }
         router = ApiKeyRouter(config=config_dict)
 
         # Verify KeyManager received the config
         assert router._key_manager._default_cooldown_seconds == 180
+        assert router._key_manager._index_refresh_seconds == 2.5
 
         # Verify QuotaAwarenessEngine received the config
         assert router._quota_awareness_engine._default_cooldown_seconds == 240
 
+        # Verify RoutingEngine received the config
+        assert router._routing_engine._max_concurrent_lookups == 4
+
     @pytest.mark.asyncio
     async def test_router_quota_engine_has_key_manager_reference(self) -> None:
         """Test that QuotaAwarenessEngine has reference to KeyManager."""
@@ -156,7 +156,11 @@ def mock_quota_engine():
             reset_at=datetime.utcnow() + timedelta(days=1),
         )
 
+    async def get_quota_states(key_ids: list[str]):
+        return {key_id: await get_quota_state(key_id) for key_id in key_ids}
+
     engine.get_quota_state = get_quota_state
+    engine.get_quota_states = get_quota_states
     return engine
 
 
@@ -1225,6 +1229,125 @@ class TestQuotaAwareRouting:
         assert decision is not None
         assert decision.selected_key_id in [key.id for key in sample_keys]
 
+    @pytest.mark.asyncio
+    async def test_route_request_fetches_quota_states_in_bulk(
+        self, routing_engine_with_quota, mock_key_manager, mock_quota_engine
+    ) -> None:
+        """Test that quota states for all keys are fetched with one bulk call."""
+        keys = [
+            await mock_key_manager.register_key(
+                key_material=f"sk-test-key-{i}",
+                provider_id="openai",
+            )
+            for i in range(5)
+        ]
+
+        bulk_calls: list[list[str]] = []
+        bulk_lookup = mock_quota_engine.get_quota_states
+
+        async def get_quota_states(key_ids: list[str]):
+            bulk_calls.append(list(key_ids))
+            return await bulk_lookup(key_ids)
+
+        mock_quota_engine.get_quota_states = get_quota_states
+
+        request_intent = {"provider_id": "openai", "request_id": "req_bulk_quota"}
+        objective = RoutingObjective(primary=ObjectiveType.Fairness.value)
+
+        decision = await routing_engine_with_quota.route_request(request_intent, objective)
+
+        assert decision.selected_key_id in {key.id for key in keys}
+        assert len(bulk_calls) == 1
+        assert set(bulk_calls[0]) == {key.id for key in keys}
+
+    @pytest.mark.asyncio
+    async def test_route_request_keeps_keys_when_bulk_quota_lookup_fails(
+        self,
+        routing_engine_with_quota,
+        mock_key_manager,
+        mock_quota_engine,
+        mock_observability,
+    ) -> None:
+        """Test graceful degradation when the bulk quota lookup fails."""
+        key1 = await mock_key_manager.register_key(
+            key_material="sk-test-key-1",
+            provider_id="openai",
+        )
+        mock_quota_engine.get_quota_states = AsyncMock(side_effect=Exception("store down"))
+
+        request_intent = {"provider_id": "openai", "request_id": "req_quota_down"}
+        objective = RoutingObjective(primary=ObjectiveType.Fairness.value)
+
+        decision = await routing_engine_with_quota.route_request(request_intent, objective)
+
+        assert decision.selected_key_id == key1.id
+        assert any(
+            "Bulk quota state lookup failed" in log["message"]
+            for log in mock_observability.logs
+        )
+
+    @pytest.mark.asyncio
+    async def test_route_request_filters_exhausted_key_when_one_lookup_fails(
+        self,
+        routing_engine_with_quota,
+        mock_key_manager,
+        mock_quota_engine,
+        mock_observability,
+    ) -> None:
+        """Test that one failing quota lookup does not disable filtering for the batch."""
+        from datetime import datetime, timedelta
+
+        from apikeyrouter.domain.models.quota_state import (
+            CapacityEstimate,
+            CapacityState,
+            QuotaState,
+            TimeWindow,
+        )
+
+        exhausted_key = await mock_key_manager.register_key(
+            key_material="sk-test-key-1",
+            provider_id="openai",
+        )
+        broken_key = await mock_key_manager.register_key(
+            key_material="sk-test-key-2",
+            provider_id="openai",
+        )
+        mock_quota_engine.quota_states[exhausted_key.id] = QuotaState(
+            id=f"quota_{exhausted_key.id}",
+            key_id=exhausted_key.id,
+            capacity_state=CapacityState.Exhausted,
+            remaining_capacity=CapacityEstimate(value=0, confidence=1.0),
+            total_capacity=1000,
+            used_capacity=1000,
+            time_window=TimeWindow.Daily,
+            reset_at=datetime.utcnow() + timedelta(days=1),
+        )
+
+        per_key_lookup = mock_quota_engine.get_quota_state
+
+        async def get_quota_state(key_id: str):
+            if key_id == broken_key.id:
+                raise Exception("corrupt quota record")
+            return await per_key_lookup(key_id)
+
+        mock_quota_engine.get_quota_state = get_quota_state
+        mock_quota_engine.get_quota_states = AsyncMock(
+            side_effect=Exception("corrupt quota record")
+        )
+
+        request_intent = {"provider_id": "openai", "request_id": "req_partial_quota"}
+        objective = RoutingObjective(primary=ObjectiveType.Fairness.value)
+
+        decision = await routing_engine_with_quota.route_request(request_intent, objective)
+
+        # The key whose lookup failed is kept (graceful degradation), but the
+        # Exhausted key is still filtered out
+        assert decision.selected_key_id == broken_key.id
+        assert any(
+            f"Failed to get quota state for key {broken_key.id}" in log["message"]
+            for log in mock_observability.logs
+        )
+
 
 class TestRoutingDecisionExplanation:
     """Tests for routing decision explanation."""
@@ -2341,3 +2464,200 @@ class TestEdgeCases:
         # Constrained should penalize by 15% (0.8 * 0.85 = 0.68)
         assert adjusted_scores[key1.id] < scores[key1.id]
         assert adjusted_scores[key1.id] == pytest.approx(0.68, abs=0.01)
+
+
+class TestBudgetFiltering:
+    """Tests for concurrent budget filtering."""
+
+    @pytest.mark.asyncio
+    async def test_filter_by_budget_resolves_shared_budget_once(
+        self, routing_engine, mock_key_manager, mock_observability
+    ) -> None:
+        """Test that a budget violated by many keys is fetched only once."""
+        from datetime import timedelta
+        from decimal import Decimal
+
+        from apikeyrouter.domain.components.cost_controller import CostController
+        from apikeyrouter.domain.models.budget import Budget, BudgetScope, EnforcementMode
+        from apikeyrouter.domain.models.budget_check_result import BudgetCheckResult
+        from apikeyrouter.domain.models.cost_estimate import CostEstimate
+        from apikeyrouter.domain.models.quota_state import TimeWindow
+        from apikeyrouter.domain.models.request_intent import Message, RequestIntent
+
+        keys = [
+            await mock_key_manager.register_key(
+                key_material=f"sk-test-key-{i}",
+                provider_id="openai",
+            )
+            for i in range(4)
+        ]
+        over_budget_ids = {keys[0].id, keys[1].id}
+
+        cost_controller = AsyncMock(spec=CostController)
+        cost_controller.estimate_request_cost = AsyncMock(
+            return_value=CostEstimate(
+                amount=Decimal("0.01"),
+                currency="USD",
+                confidence=0.9,
+                estimation_method="test",
+                input_tokens_estimate=100,
+                output_tokens_estimate=50,
+            )
+        )
+
+        async def check_budget(request_intent, cost_estimate, provider_id, key_id):
+            if key_id in over_budget_ids:
+                return BudgetCheckResult(
+                    allowed=False,
+                    remaining_budget=Decimal("0"),
+                    would_exceed=True,
+                    violated_budgets=["global_budget"],
+                )
+            return BudgetCheckResult(
+                allowed=True, remaining_budget=Decimal("10"), would_exceed=False
+            )
+
+        cost_controller.check_budget = AsyncMock(side_effect=check_budget)
+        cost_controller.get_budget = AsyncMock(
+            return_value=Budget(
+                id="global_budget",
+                scope=BudgetScope.Global,
+                limit_amount=Decimal("1.00"),
+                period=TimeWindow.Daily,
+                enforcement_mode=EnforcementMode.Hard,
+                reset_at=datetime.utcnow() + timedelta(days=1),
+            )
+        )
+
+        engine = RoutingEngine(
+            key_manager=mock_key_manager,
+            state_store=routing_engine._state_store,
+            observability_manager=mock_observability,
+            cost_controller=cost_controller,
+        )
+        request_intent = RequestIntent(
+            model="gpt-4", messages=[Message(role="user", content="Test message")]
+        )
+
+        kept, budget_results, cost_estimates, filtered = await engine._filter_by_budget(
+            keys, request_intent, "openai"
+        )
+
+        assert [key.id for key in kept] == [keys[2].id, keys[3].id]
+        assert {key.id for key in filtered} == over_budget_ids
+        assert set(budget_results) == {key.id for key in keys}
+        assert set(cost_estimates) == {key.id for key in keys}
+        cost_controller.get_budget.assert_awaited_once_with("global_budget")
+
+    @pytest.mark.asyncio
+    async def test_filter_by_budget_keeps_key_when_check_fails(
+        self, routing_engine, mock_key_manager, mock_observability
+    ) -> None:
+        """Test that a failing budget check for one key does not drop it."""
+        from apikeyrouter.domain.components.cost_controller import CostController
+        from apikeyrouter.domain.models.request_intent import Message, RequestIntent
+
+        key1 = await mock_key_manager.register_key(
+            key_material="sk-test-key-1",
+            provider_id="openai",
+        )
+
+        cost_controller = AsyncMock(spec=CostController)
+        cost_controller.estimate_request_cost = AsyncMock(side_effect=Exception("pricing down"))
+
+        engine = RoutingEngine(
+            key_manager=mock_key_manager,
+            state_store=routing_engine._state_store,
+            observability_manager=mock_observability,
+            cost_controller=cost_controller,
+        )
+        request_intent = RequestIntent(
+            model="gpt-4", messages=[Message(role="user", content="Test message")]
+        )
+
+        kept, budget_results, _, filtered = await engine._filter_by_budget(
+            [key1], request_intent, "openai"
+        )
+
+        assert kept == [key1]
+        assert budget_results == {}
+        assert filtered == []
+        assert any(
+            f"Failed to check budget for key {key1.id}" in log["message"]
+            for log in mock_observability.logs
+        )
+
+    @pytest.mark.asyncio
+    async def test_filter_by_budget_caps_concurrent_lookups(
+        self, routing_engine, mock_key_manager, mock_observability
+    ) -> None:
+        """Test that per-key budget lookups respect max_concurrent_lookups."""
+        import asyncio
+        from decimal import Decimal
+
+        from apikeyrouter.domain.components.cost_controller import CostController
+        from apikeyrouter.domain.models.budget_check_result import BudgetCheckResult
+        from apikeyrouter.domain.models.cost_estimate import CostEstimate
+        from apikeyrouter.domain.models.request_intent import Message, RequestIntent
+
+        keys = [
+            await mock_key_manager.register_key(
+                key_material=f"sk-test-key-{i}",
+                provider_id="openai",
+            )
+            for i in range(10)
+        ]
+
+        in_flight = 0
+        peak = 0
+
+        async def estimate_request_cost(request_intent, provider_id, key_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return CostEstimate(
+                amount=Decimal("0.01"),
+                currency="USD",
+                confidence=0.9,
+                estimation_method="test",
+                input_tokens_estimate=100,
+                output_tokens_estimate=50,
+            )
+
+        cost_controller = AsyncMock(spec=CostController)
+        cost_controller.estimate_request_cost = AsyncMock(side_effect=estimate_request_cost)
+        cost_controller.check_budget = AsyncMock(
+            return_value=BudgetCheckResult(
+                allowed=True, remaining_budget=Decimal("10"), would_exceed=False
+            )
+        )
+
+        engine = RoutingEngine(
+            key_manager=mock_key_manager,
+            state_store=routing_engine._state_store,
+            observability_manager=mock_observability,
+            cost_controller=cost_controller,
+            max_concurrent_lookups=3,
+        )
+        request_intent = RequestIntent(
+            model="gpt-4", messages=[Message(role="user", content="Test message")]
+        )
+
+        kept, _, _, _ = await engine._filter_by_budget(keys, request_intent, "openai")
+
+        assert len(kept) == len(keys)
+        assert peak == 3
+
+    def test_rejects_non_positive_max_concurrent_lookups(
+        self, mock_key_manager, mock_state_store, mock_observability
+    ) -> None:
+        """Test that max_concurrent_lookups must be at least 1."""
+        with pytest.raises(ValueError, match="max_concurrent_lookups"):
+            RoutingEngine(
+                key_manager=mock_key_manager,
+                state_store=mock_state_store,
+                observability_manager=mock_observability,
+                max_concurrent_lookups=0,
+            )
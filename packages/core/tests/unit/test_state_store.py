@@ -286,3 +286,51 @@ class TestStateStoreInterface:
         for method_name in methods:
             method = getattr(StateStore, method_name)
             assert inspect.iscoroutinefunction(method), f"{method_name} should be async"
+
+    @pytest.mark.asyncio
+    async def test_default_get_quota_states_delegates_to_get_quota_state(self) -> None:
+        """Test that the default get_quota_states fans out to get_quota_state."""
+        from datetime import timedelta
+
+        from apikeyrouter.domain.models.quota_state import CapacityEstimate
+
+        stored = {
+            key_id: QuotaState(
+                id=f"quota_{key_id}",
+                key_id=key_id,
+                remaining_capacity=CapacityEstimate(value=100),
+                reset_at=datetime.utcnow() + timedelta(days=1),
+            )
+            for key_id in ("key1", "key2")
+        }
+        calls: list[str] = []
+
+        class SingleGetStore(StateStore):
+            """Store that only implements the per-key lookup."""
+
+            async def save_key(self, key: APIKey) -> None: ...
+
+            async def get_key(self, key_id: str) -> APIKey | None: ...
+
+            async def list_keys(self, provider_id: str | None = None) -> list[APIKey]:
+                return []
+
+            async def save_quota_state(self, state: QuotaState) -> None: ...
+
+            async def get_quota_state(self, key_id: str) -> QuotaState | None:
+                calls.append(key_id)
+                return stored.get(key_id)
+
+            async def save_routing_decision(self, decision: RoutingDecision) -> None: ...
+
+            async def save_state_transition(self, transition: StateTransition) -> None: ...
+
+            async def query_state(self, query: StateQuery) -> list[Any]:
+                return []
+
+        store = SingleGetStore()
+
+        result = await store.get_quota_states(["key1", "key2", "key1", "missing"])
+
+        assert result == stored
+        assert sorted(calls) == ["key1", "key2", "missing"]